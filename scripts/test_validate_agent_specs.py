@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the agent specification validator
+
+Usage:
+    python3 -m unittest discover -s scripts -p "test_*.py"
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validate_agent_specs import AgentSpecValidator  # noqa: E402
+
+
+class ValidatorTestCase(unittest.TestCase):
+    """Runs the validator against a single spec written to a temporary directory"""
+
+    def validate(self, content: bytes, filename: str = "test-agent.md"):
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / filename
+            filepath.write_bytes(content)
+            validator = AgentSpecValidator(Path(tmp), quiet=True)
+            validator.validate_file(filepath)
+        return validator.errors
+
+    def error_types(self, errors, error_type: str):
+        return [e.details for e in errors if e.error_type == error_type]
+
+
+class HeaderParsingTest(ValidatorTestCase):
+    """'##' lines without a name must not end the current section"""
+
+    SPEC = "## Capabilities\n{blank}\n### Core Capabilities\n### Technical Skills\n"
+
+    def assert_no_missing_subsections(self, blank: str, newline: str = "\n"):
+        content = self.SPEC.format(blank=blank).replace("\n", newline).encode()
+        errors = self.validate(content)
+        self.assertEqual(self.error_types(errors, "MISSING_SUBSECTION"), [])
+
+    def test_header_with_trailing_space_only(self):
+        self.assert_no_missing_subsections("## ")
+
+    def test_header_with_trailing_tab_only(self):
+        self.assert_no_missing_subsections("##\t")
+
+    def test_bare_header_with_crlf(self):
+        self.assert_no_missing_subsections("##", newline="\r\n")
+
+    def test_header_with_trailing_space_and_crlf(self):
+        self.assert_no_missing_subsections("## ", newline="\r\n")
+
+    def test_unicode_whitespace_around_name(self):
+        errors = self.validate("##\u00a0Capabilities\u00a0\n".encode())
+        self.assertNotIn(
+            "Required section '## Capabilities' not found",
+            self.error_types(errors, "MISSING_SECTION"),
+        )
+
+
+class RoleFieldTest(ValidatorTestCase):
+    """The **Role**: window is 500 characters, not 500 bytes"""
+
+    def role_errors(self, content: str):
+        errors = self.validate(content.encode())
+        return [d for d in self.error_types(errors, "MISSING_FIELD") if "Role" in d]
+
+    def test_role_after_multibyte_text(self):
+        # 300 CJK characters are 900 bytes of UTF-8
+        self.assertEqual(self.role_errors("# " + "漢" * 300 + "\n**Role**: qa\n"), [])
+
+    def test_role_after_crlf_lines(self):
+        # Role starts at character 490 but byte 539
+        self.assertEqual(self.role_errors(("y" * 9 + "\r\n") * 49 + "**Role**: qa\r\n"), [])
+
+    def test_role_beyond_window(self):
+        self.assertNotEqual(self.role_errors("—" * 500 + "**Role**: qa\n"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
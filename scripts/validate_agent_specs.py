@@ -6,18 +6,31 @@ This script validates that all agent specification files in docs/agents/
 contain the required sections and fields as defined in the template.
 
 Usage:
-    python scripts/validate_agent_specs.py
+    python scripts/validate_agent_specs.py [--jobs N] [--quiet] [--no-cache] [--fast-fail]
+
+Options:
+    --jobs N      Validate files in N worker processes (0 = one per CPU, default 1)
+    --quiet       Do not print a line for every file validated
+    --no-cache    Ignore and do not update the results cache (.validator_cache.json)
+    --fast-fail   Stop at the first error (one error from the first failing file)
+
+Results are cached per file, keyed by a hash of the file content and of this
+script, so unchanged specs are not re-validated on the next run.
 
 Exit codes:
     0 - All validations passed
     1 - Validation failures found
 """
 
+import argparse
+import functools
+import hashlib
+import json
 import os
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, NamedTuple, Optional
 
 # Required sections that must be present in every agent spec
 REQUIRED_SECTIONS = [
@@ -47,27 +60,102 @@ REQUIRED_SUBSECTIONS = {
     "Ownership & Maintenance": [],
 }
 
+# Frozen copies of the requirements (built once at import) for set-difference checks
+_REQUIRED_SECTION_SET = frozenset(REQUIRED_SECTIONS)
+_REQUIRED_SUBSECTION_SETS = {
+    section: frozenset(subsections)
+    for section, subsections in REQUIRED_SUBSECTIONS.items()
+    if subsections
+}
+
 # Required fields in Ownership & Maintenance
 REQUIRED_OWNERSHIP_FIELDS = ["Owner", "Backup Owner", "Last Updated", "Review Frequency"]
+_REQUIRED_OWNERSHIP_FIELD_SET = frozenset(REQUIRED_OWNERSHIP_FIELDS)
+
+# Below this many files, process start-up costs more than parallel validation saves
+PARALLEL_MIN_FILES = 4
+
+# Per-file results cache, stored in the repository root
+CACHE_FILENAME = ".validator_cache.json"
+
+
+class _Patterns(NamedTuple):
+    """Compiled regular expressions used by the validator"""
+    header: re.Pattern
+    event: re.Pattern
+    ownership_fields: re.Pattern
+
+
+@functools.cache
+def _get_patterns() -> _Patterns:
+    """Compile the validator patterns on first use (skipped for --help and error paths)
+
+    Patterns operate on the raw UTF-8 bytes of each file; only matched names are decoded.
+    """
+    return _Patterns(
+        # Section (##) and subsection (###) headers. Leading with the literal '##'
+        # lets the engine jump between candidates; the lookbehind anchors to line start.
+        # The whitespace after the hashes is checked on the decoded name, so Unicode
+        # spaces (e.g. NBSP) count as they do in str patterns.
+        header=re.compile(rb'##(?<![^\n]##)(#?)(.+)$', re.MULTILINE),
+        event=re.compile(rb'`agent\.([a-z-]+)\.'),
+        # Any required field in format "- **Field**: value" or "**Field**: value"
+        ownership_fields=re.compile(
+            rb'\*\*('
+            + b'|'.join(re.escape(field.encode()) for field in REQUIRED_OWNERSHIP_FIELDS)
+            + rb')\*\*:'
+        ),
+    )
+
+
+@functools.cache
+def _validator_fingerprint() -> str:
+    """Hash of this script, so cached results are dropped whenever the rules change"""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def _is_cache_entry(entry) -> bool:
+    """Check a loaded cache entry has the shape written by _check_file"""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("hash"), str)
+        and isinstance(entry.get("errors"), list)
+        and all(
+            isinstance(error, list) and len(error) == 2
+            and all(isinstance(part, str) for part in error)
+            for error in entry["errors"]
+        )
+    )
 
 
-class ValidationError:
-    """Represents a validation error"""
-    def __init__(self, filename: str, error_type: str, details: str):
-        self.filename = filename
-        self.error_type = error_type
-        self.details = details
-
-    def __str__(self):
-        return f"❌ {self.filename}: [{self.error_type}] {self.details}"
+class ValidationError(NamedTuple):
+    """Represents a validation error (formatted only when the summary is printed)"""
+    filename: str
+    error_type: str
+    details: str
 
 
 class AgentSpecValidator:
     """Validates agent specification files"""
 
-    def __init__(self, agents_dir: Path):
+    def __init__(
+        self,
+        agents_dir: Path,
+        jobs: int = 1,
+        quiet: bool = False,
+        cache_path: Optional[Path] = None,
+        fast_fail: bool = False,
+    ):
         self.agents_dir = agents_dir
+        self.jobs = jobs
+        self.quiet = quiet
+        self.cache_path = cache_path
+        self.fast_fail = fast_fail
         self.errors: List[ValidationError] = []
+        # filename -> {'hash': content hash, 'errors': [[error_type, details], ...]}
+        self._cache: Dict[str, Dict] = {}
+        # Entries as loaded from disk, so an unchanged cache is not rewritten
+        self._loaded_cache: Optional[Dict[str, Dict]] = None
 
     def validate_all(self) -> bool:
         """Validate all agent spec files in the directory"""
@@ -75,11 +163,14 @@ class AgentSpecValidator:
             print(f"❌ Error: Directory {self.agents_dir} does not exist")
             return False
 
-        # Get all markdown files except TEMPLATE.md
-        agent_files = [
-            f for f in self.agents_dir.glob("*.md")
-            if f.name != "TEMPLATE.md" and f.name != "README.md"
-        ]
+        # Get all markdown files except TEMPLATE.md and README.md
+        with os.scandir(self.agents_dir) as entries:
+            agent_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".md")
+                and entry.name not in ("TEMPLATE.md", "README.md")
+                and entry.is_file()
+            ]
 
         if not agent_files:
             print(f"⚠️  Warning: No agent specification files found in {self.agents_dir}")
@@ -87,70 +178,200 @@ class AgentSpecValidator:
 
         print(f"🔍 Validating {len(agent_files)} agent specification(s)...\n")
 
-        for agent_file in sorted(agent_files):
-            self.validate_file(agent_file)
+        agent_files = sorted(agent_files)
+        self._load_cache()
+
+        if self.jobs > 1 and len(agent_files) >= PARALLEL_MIN_FILES:
+            # Imported here: multiprocessing roughly doubles start-up for serial runs
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Files are independent; map() keeps results in input order
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                cached = [self._cache.get(f.name) for f in agent_files]
+                fast_fail = [self.fast_fail] * len(agent_files)
+                results = executor.map(_validate_one, agent_files, cached, fast_fail)
+                for agent_file, (errors, entry) in zip(agent_files, results):
+                    if not self.quiet:
+                        print(f"📄 Validating {agent_file.name}...")
+                    self.errors.extend(errors)
+                    if entry is not None:
+                        self._cache[agent_file.name] = entry
+                    if self.fast_fail and errors:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+        else:
+            for agent_file in agent_files:
+                self.validate_file(agent_file)
+                if self.fast_fail and self.errors:
+                    break
+
+        self._save_cache(agent_files)
 
         return len(self.errors) == 0
 
+    def _load_cache(self) -> None:
+        """Load cached results, discarding them if they came from a different validator"""
+        if self.cache_path is None:
+            return
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return  # Missing or corrupt cache: validate everything
+
+        if not isinstance(data, dict) or data.get("validator") != _validator_fingerprint():
+            return
+
+        files = data.get("files")
+        if not isinstance(files, dict) or not all(map(_is_cache_entry, files.values())):
+            return  # Unexpected structure: validate everything
+
+        self._cache = files
+        self._loaded_cache = dict(files)
+
+    def _save_cache(self, agent_files: List[Path]) -> None:
+        """Persist results for the files validated in this run"""
+        if self.cache_path is None:
+            return
+
+        files = {f.name: self._cache[f.name] for f in agent_files if f.name in self._cache}
+        if files == self._loaded_cache:
+            return  # Nothing changed since it was loaded
+
+        data = {"validator": _validator_fingerprint(), "files": files}
+        try:
+            self.cache_path.write_text(json.dumps(data, indent=2) + "\n", encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write cache {self.cache_path}: {e}")
+
     def validate_file(self, filepath: Path) -> None:
         """Validate a single agent specification file"""
-        print(f"📄 Validating {filepath.name}...")
+        if not self.quiet:
+            print(f"📄 Validating {filepath.name}...")
+        self._check_file(filepath)
 
+    def _check_file(self, filepath: Path) -> None:
+        """Run all checks against a single file, recording errors"""
+        first_error = len(self.errors)
         try:
-            content = filepath.read_text(encoding='utf-8')
+            # Raw bytes: pure-ASCII specs skip the UTF-8 decode; other specs are decoded
+            # (which validates them) and the text is kept for character-based checks
+            content = filepath.read_bytes()
+            text = None if content.isascii() else content.decode('utf-8')
         except Exception as e:
             self.errors.append(
                 ValidationError(filepath.name, "READ_ERROR", f"Failed to read file: {e}")
             )
             return
 
-        # Extract all section headers (lines starting with ##)
-        sections = self._extract_sections(content)
+        # Reuse the previous result if the file is unchanged since it was cached
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        entry = self._cache.get(filepath.name)
+        if entry is not None and entry.get("hash") == digest:
+            cached_errors = entry["errors"][:1] if self.fast_fail else entry["errors"]
+            self.errors.extend(
+                ValidationError(filepath.name, error_type, details)
+                for error_type, details in cached_errors
+            )
+            return
+
+        patterns = _get_patterns()
+
+        # Parse sections and subsections once; all checks below reuse the result
+        sections = self._extract_sections(content, patterns)
 
         # Check for required sections
         self._check_required_sections(filepath.name, sections)
+        if self._stop_early(first_error):
+            return
 
         # Check for required subsections
-        self._check_required_subsections(filepath.name, content, sections)
+        self._check_required_subsections(filepath.name, sections)
+        if self._stop_early(first_error):
+            return
 
         # Check ownership fields
-        self._check_ownership_fields(filepath.name, content)
+        self._check_ownership_fields(filepath.name, sections, patterns)
+        if self._stop_early(first_error):
+            return
 
         # Check for role field at the top
-        self._check_role_field(filepath.name, content)
+        self._check_role_field(filepath.name, content, text)
+        if self._stop_early(first_error):
+            return
 
         # Check telemetry events follow naming convention
-        self._check_telemetry_events(filepath.name, content)
-
-    def _extract_sections(self, content: str) -> Dict[str, str]:
-        """Extract all sections from the markdown content"""
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in content.split('\n'):
-            # Check for section headers (## Header)
-            match = re.match(r'^##\s+(.+)$', line)
-            if match:
-                # Save previous section
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                # Start new section
-                current_section = match.group(1).strip()
-                current_content = []
-            elif current_section:
-                current_content.append(line)
-
-        # Save last section
-        if current_section:
-            sections[current_section] = '\n'.join(current_content)
+        self._check_telemetry_events(filepath.name, sections, patterns)
+        if self._stop_early(first_error):
+            return
+
+        # Only complete results are cached; fast-fail runs stop before this point
+        self._cache[filepath.name] = {
+            "hash": digest,
+            "errors": [[e.error_type, e.details] for e in self.errors[first_error:]],
+        }
+
+    def _stop_early(self, first_error: int) -> bool:
+        """In fast-fail mode, keep only the file's first error and stop checking it"""
+        if not self.fast_fail or len(self.errors) <= first_error:
+            return False
+        del self.errors[first_error + 1:]
+        return True
+
+    def _extract_sections(self, content: bytes, patterns: _Patterns) -> Dict[str, Dict]:
+        """Extract all sections and their subsections from the markdown content
+
+        Returns a mapping of section name to ``{'_body': bytes, 'subs': {name: body}}``,
+        where each subsection body runs up to the next header of either level.
+        """
+        sections: Dict[str, Dict] = {}
+        current = None  # section being filled
+        current_start = 0
+        sub_name = None  # open subsection of the current section
+        sub_start = 0
+
+        # Single walk over the headers; each header closes whatever is still open
+        for match in patterns.header.finditer(content):
+            start = match.start()
+            if sub_name is not None:
+                current['subs'][sub_name] = content[sub_start:start]
+                sub_name = None
+
+            level, raw_name = match.group(1, 2)
+            # Drop the CR of a CRLF ending (read_text used to translate it away), then
+            # require whitespace plus at least one more character, as '^##\s+(.+)$' did
+            raw_name = raw_name.decode('utf-8').removesuffix('\r')
+            if len(raw_name) < 2 or not raw_name[0].isspace():
+                continue  # e.g. '##Name', '####' or '## ', not a header
+            name = raw_name.strip()
+            if not level:
+                if current is not None:
+                    current['_body'] = content[current_start:start]
+                current = None
+                if name:
+                    current = sections[name] = {'_body': b'', 'subs': {}}
+                    current_start = match.end()
+            elif current is not None and name:
+                sub_name = name
+                sub_start = match.end()
+
+        # Close whatever is still open at the end of the file
+        if sub_name is not None:
+            current['subs'][sub_name] = content[sub_start:]
+        if current is not None:
+            current['_body'] = content[current_start:]
 
         return sections
 
-    def _check_required_sections(self, filename: str, sections: Dict[str, str]) -> None:
+    def _check_required_sections(self, filename: str, sections: Dict[str, Dict]) -> None:
         """Check if all required sections are present"""
+        missing = _REQUIRED_SECTION_SET.difference(sections)
+        if not missing:
+            return
+
+        # Report in template order
         for required_section in REQUIRED_SECTIONS:
-            if required_section not in sections:
+            if required_section in missing:
                 self.errors.append(
                     ValidationError(
                         filename,
@@ -159,18 +380,20 @@ class AgentSpecValidator:
                     )
                 )
 
-    def _check_required_subsections(
-        self, filename: str, content: str, sections: Dict[str, str]
-    ) -> None:
+    def _check_required_subsections(self, filename: str, sections: Dict[str, Dict]) -> None:
         """Check if required subsections are present within sections"""
-        for section, required_subsections in REQUIRED_SUBSECTIONS.items():
+        for section, required_subsections in _REQUIRED_SUBSECTION_SETS.items():
             if section not in sections:
                 continue  # Already reported as missing section
 
-            section_content = sections[section]
-            for subsection in required_subsections:
-                # Check for subsection header (### Subsection)
-                if f"### {subsection}" not in section_content:
+            # Subsection headers (### Subsection) were collected by the extractor
+            missing = required_subsections.difference(sections[section]['subs'])
+            if not missing:
+                continue
+
+            # Report in template order
+            for subsection in REQUIRED_SUBSECTIONS[section]:
+                if subsection in missing:
                     self.errors.append(
                         ValidationError(
                             filename,
@@ -179,24 +402,29 @@ class AgentSpecValidator:
                         )
                     )
 
-    def _check_ownership_fields(self, filename: str, content: str) -> None:
+    def _check_ownership_fields(
+        self, filename: str, sections: Dict[str, Dict], patterns: _Patterns
+    ) -> None:
         """Check if required ownership fields are present"""
-        # Find the Ownership & Maintenance section
-        ownership_match = re.search(
-            r'## Ownership & Maintenance\s+(.+?)(?=\n##|\Z)',
-            content,
-            re.DOTALL
-        )
+        ownership = sections.get("Ownership & Maintenance")
 
-        if not ownership_match:
+        if ownership is None:
             return  # Already reported as missing section
 
-        ownership_content = ownership_match.group(1)
+        ownership_content = ownership['_body']
+
+        # Collect every field present in a single scan
+        found = {
+            m.group(1).decode() for m in patterns.ownership_fields.finditer(ownership_content)
+        }
 
+        missing = _REQUIRED_OWNERSHIP_FIELD_SET.difference(found)
+        if not missing:
+            return
+
+        # Report in template order
         for field in REQUIRED_OWNERSHIP_FIELDS:
-            # Look for field in format "- **Field**: value" or "**Field**: value"
-            field_pattern = f"\\*\\*{re.escape(field)}\\*\\*:"
-            if not re.search(field_pattern, ownership_content):
+            if field in missing:
                 self.errors.append(
                     ValidationError(
                         filename,
@@ -205,10 +433,19 @@ class AgentSpecValidator:
                     )
                 )
 
-    def _check_role_field(self, filename: str, content: str) -> None:
+    def _check_role_field(self, filename: str, content: bytes, text: Optional[str]) -> None:
         """Check if **Role**: field is present near the top"""
-        # Look for Role field in first 500 characters
-        if not re.search(r'\*\*Role\*\*:', content[:500]):
+        # Look for Role field in first 500 characters (plain substring search, no regex
+        # needed). Line endings count as one character, as they did with read_text.
+        if text is None and b'\r' not in content[:1000]:
+            # ASCII with LF endings: byte offsets are character offsets
+            found = content.find(b'**Role**:', 0, 500) != -1
+        else:
+            # Each character takes at most two here (CRLF), so 1000 covers 500 once normalised
+            head = (text if text is not None else content.decode('ascii'))[:1000]
+            found = '**Role**:' in head.replace('\r\n', '\n').replace('\r', '\n')[:500]
+
+        if not found:
             self.errors.append(
                 ValidationError(
                     filename,
@@ -217,58 +454,90 @@ class AgentSpecValidator:
                 )
             )
 
-    def _check_telemetry_events(self, filename: str, content: str) -> None:
+    def _check_telemetry_events(
+        self, filename: str, sections: Dict[str, Dict], patterns: _Patterns
+    ) -> None:
         """Check that telemetry events follow naming convention"""
-        # Find Events to Track section
-        events_match = re.search(
-            r'### Events to Track\s+(.+?)(?=\n###|\n##|\Z)',
-            content,
-            re.DOTALL
-        )
+        telemetry = sections.get("Telemetry & Monitoring")
+        events_content = telemetry['subs'].get("Events to Track") if telemetry else None
 
-        if not events_match:
-            return  # Subsection validation will catch this
-
-        events_content = events_match.group(1)
+        if events_content is None:
+            return  # Section/subsection validation will catch this
 
         # Extract agent name from filename (e.g., frontend-assistant.md -> frontend-assistant)
         agent_name = Path(filename).stem
 
-        # Look for event patterns like `agent.NAME.event`
-        event_pattern = r'`agent\.([a-z-]+)\.'
-        events = re.findall(event_pattern, events_content)
+        # Fast path: at least one event already uses `agent.NAME.`
+        if f"`agent.{agent_name}.".encode() in events_content:
+            return
 
-        if events:
-            # Check if at least some events use the correct agent name
-            correct_events = [e for e in events if e == agent_name]
-            if not correct_events:
-                self.errors.append(
-                    ValidationError(
-                        filename,
-                        "TELEMETRY_NAMING",
-                        f"Telemetry events should follow pattern `agent.{agent_name}.*`"
-                    )
+        # Look for event patterns like `agent.NAME.event` to report what was used instead
+        events = [name.decode() for name in patterns.event.findall(events_content)]
+
+        if events and agent_name not in events:
+            used = ", ".join(f"`agent.{name}.*`" for name in dict.fromkeys(events))
+            self.errors.append(
+                ValidationError(
+                    filename,
+                    "TELEMETRY_NAMING",
+                    f"Telemetry events should follow pattern `agent.{agent_name}.*` "
+                    f"(found {used})"
                 )
+            )
 
     def print_summary(self) -> None:
-        """Print validation summary"""
-        print()
+        """Print validation summary (in a single write)"""
+        rule = "=" * 70
         if self.errors:
-            print("=" * 70)
-            print("VALIDATION FAILURES")
-            print("=" * 70)
-            for error in self.errors:
-                print(error)
-            print()
-            print(f"❌ Validation failed with {len(self.errors)} error(s)")
+            lines = ["", rule, "VALIDATION FAILURES", rule]
+            lines.extend(
+                f"❌ {error.filename}: [{error.error_type}] {error.details}"
+                for error in self.errors
+            )
+            lines += ["", f"❌ Validation failed with {len(self.errors)} error(s)"]
         else:
-            print("=" * 70)
-            print("✅ All agent specifications passed validation!")
-            print("=" * 70)
+            lines = ["", rule, "✅ All agent specifications passed validation!", rule]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _validate_one(
+    filepath: Path, cached: Optional[Dict] = None, fast_fail: bool = False
+) -> Tuple[List[ValidationError], Optional[Dict]]:
+    """Validate a single file in isolation (picklable for worker processes)
+
+    Returns the file's errors and its updated cache entry.
+    """
+    validator = AgentSpecValidator(filepath.parent, fast_fail=fast_fail)
+    if cached is not None:
+        validator._cache[filepath.name] = cached
+    validator._check_file(filepath)
+    return validator.errors, validator._cache.get(filepath.name)
 
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Validate agent specification files")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="number of worker processes (0 = one per CPU, default: 1)"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="do not print a line for every file validated"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"ignore and do not update the results cache ({CACHE_FILENAME})"
+    )
+    parser.add_argument(
+        "--fast-fail", action="store_true",
+        help="stop at the first error (pass/fail check for pre-commit hooks)"
+    )
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (one per CPU) or a positive number")
+    jobs = args.jobs or os.cpu_count() or 1
+
     # Determine the repository root (parent of scripts/)
     script_dir = Path(__file__).parent
     repo_root = script_dir.parent
@@ -280,7 +549,15 @@ def main():
     print(f"Agents directory: {agents_dir}")
     print()
 
-    validator = AgentSpecValidator(agents_dir)
+    cache_path = None if args.no_cache else repo_root / CACHE_FILENAME
+
+    validator = AgentSpecValidator(
+        agents_dir,
+        jobs=jobs,
+        quiet=args.quiet,
+        cache_path=cache_path,
+        fast_fail=args.fast_fail,
+    )
     success = validator.validate_all()
     validator.print_summary()
 